@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 import pyS7
 from pyS7.address_parser import S7AddressError, map_address_to_tag
 from pyS7.constants import DataType, MemoryArea
@@ -17,11 +19,13 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def parse_tag(address: str) -> S7Tag:
     """Parse an address into an ``S7Tag``.
 
     Raises ``ValueError`` if the address cannot be parsed. The returned tag
-    always has the bit offset remapped when needed.
+    always has the bit offset remapped when needed. Results are memoized;
+    ``S7Tag`` is frozen, so callers can share the returned instance.
     """
     try:
         tag = map_address_to_tag(address)
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
 import struct
 import time
 from datetime import datetime, timedelta
-from typing import Any, Callable, TypeVar
+from functools import partial
+from typing import Any, Callable, Iterable, Sequence
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -14,13 +16,88 @@ from pyS7.constants import ConnectionType
 from pyS7.errors import S7CommunicationError, S7ConnectionError, S7ReadResponseError
 
 from .address import DataType, MemoryArea, S7Tag, parse_tag, pyS7
-from .plans import StringPlan, TagPlan, apply_postprocess, build_plans
+from .plans import (
+    StringPlan,
+    TagPlan,
+    apply_postprocess,
+    build_plans,
+    group_batch_plans,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-# Type variable for S7Client
-S7ClientT = TypeVar("S7ClientT")
+# -----------------------------
+# Single-tag read dispatch
+# -----------------------------
+# String data types read through _read_s7_string -> is_wstring
+_STRING_READS: dict[DataType, bool] = {
+    DataType.STRING: False,
+    DataType.WSTRING: True,
+}
+
+# Post-processing applied to ad-hoc scalar reads, keyed by data type
+_SINGLE_READ_POST: dict[DataType, Callable[[Any], Any]] = {
+    DataType.BIT: bool,
+    DataType.REAL: partial(apply_postprocess, DataType.REAL),
+    DataType.LREAL: partial(apply_postprocess, DataType.LREAL),
+}
+
+
+# -----------------------------
+# Write payload coercion
+# -----------------------------
+def _coerce_bit(tag: S7Tag, value: Any, address: str) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError(
+            f"BIT address {address} requires bool value, " f"got {type(value).__name__}"
+        )
+    return bool(value)
+
+
+def _coerce_string(tag: S7Tag, value: Any, address: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(
+            f"STRING/WSTRING address {address} requires str value, "
+            f"got {type(value).__name__}"
+        )
+    return str(value)
+
+
+def _coerce_real(tag: S7Tag, value: Any, address: str) -> float:
+    if not isinstance(value, (int, float)):
+        raise ValueError(
+            f"{tag.data_type.name} address {address} requires numeric value, "
+            f"got {type(value).__name__}"
+        )
+    return float(value)
+
+
+def _coerce_integer(tag: S7Tag, value: Any, address: str) -> int:
+    if not isinstance(value, (int, float)):
+        raise ValueError(
+            f"{tag.data_type.name} address {address} requires "
+            f"numeric value, got {type(value).__name__}"
+        )
+    return int(round(float(value)))
+
+
+# Data type -> payload coercer, so a write does one lookup instead of
+# walking an if/elif chain over the data types.
+_PAYLOAD_COERCERS: dict[DataType, Callable[[S7Tag, Any, str], Any]] = {
+    DataType.BIT: _coerce_bit,
+    DataType.STRING: _coerce_string,
+    DataType.WSTRING: _coerce_string,
+    DataType.REAL: _coerce_real,
+    DataType.LREAL: _coerce_real,
+    DataType.BYTE: _coerce_integer,
+    DataType.WORD: _coerce_integer,
+    DataType.DWORD: _coerce_integer,
+    DataType.INT: _coerce_integer,
+    DataType.DINT: _coerce_integer,
+    DataType.USINT: _coerce_integer,
+    DataType.SINT: _coerce_integer,
+}
 
 
 # -----------------------------
@@ -78,12 +155,21 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Timeout/retry settings
         self._op_timeout = float(op_timeout)
+        self._op_timeout_ns = int(self._op_timeout * 1_000_000_000)
         self._max_retries = int(max_retries)
         self._backoff_initial = float(backoff_initial)
         self._backoff_max = float(backoff_max)
+        # Backoff before retry N, capped at _backoff_max
+        self._backoff_schedule = tuple(
+            min(self._backoff_initial * (1 << attempt), self._backoff_max)
+            for attempt in range(max(self._max_retries, 0))
+        )
         self._optimize_read = bool(optimize_read)
         self._enable_write_batching = bool(enable_write_batching)
         self._enable_metrics = bool(enable_metrics)
+        # Debug logging flag, refreshed once per poll cycle so the hot path
+        # does not build log arguments when debug output is disabled
+        self._log_debug = _LOGGER.isEnabledFor(logging.DEBUG)
         # Lock for async operations (state management)
         self._async_lock = asyncio.Lock()
         self._client: Any | None = None  # pyS7.AsyncS7Client when available
@@ -94,13 +180,41 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Read plan cache
         self._plans_batch: dict[str, TagPlan] = {}
         self._plans_str: dict[str, StringPlan] = {}
+        # Set once plans are built, cleared whenever items change
+        self._cache_valid = False
+
+        # Scalar plans deduplicated by tag at build time, plus a
+        # topic -> (group index, plan) index used to pick due groups per poll
+        self._batch_groups: list[tuple[S7Tag, list[TagPlan]]] = []
+        self._batch_tags: list[S7Tag] = []
+        self._batch_group_of: dict[str, tuple[int, TagPlan]] = {}
+        # Flattened (value index, topic, postprocess) rows for dispatching a
+        # full read, and the topics alone when every group is a single plan
+        # without post-processing (values then map 1:1 onto topics)
+        self._batch_dispatch: tuple[
+            tuple[int, str, Callable[[Any], Any] | None], ...
+        ] = ()
+        self._batch_topics: tuple[str, ...] | None = None
+        # Every plan, published as immutable tuples for polls where all
+        # topics are due
+        self._all_plans_batch: tuple[TagPlan, ...] = ()
+        self._all_plans_str: tuple[StringPlan, ...] = ()
+
+        # Scratch tag list reused by _read_batch across polls
+        self._scratch_tags: list[S7Tag] = []
+        self._scratch_busy = False
 
         # Cache for parsed tags (shared by reads and writes)
         self._tag_cache: dict[str, S7Tag] = {}
+        # (db, start, length, is_wstring) -> STRING/WSTRING tag for ad-hoc reads
+        self._string_tags: dict[tuple[int, int, int, bool], S7Tag] = {}
 
         # Scan interval bookkeeping
         self._item_scan_intervals: dict[str, float] = {}
         self._item_next_read: dict[str, float] = {}
+        # Min-heap of (next_read, topic); entries whose time no longer matches
+        # _item_next_read are stale and skipped when popped
+        self._due_heap: list[tuple[float, str]] = []
 
         # Precision for REAL items (topic -> decimals or None for full precision)
         self._item_real_precisions: dict[str, int | None] = {}
@@ -108,6 +222,9 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Store the latest values so entities keep their last state when a tag
         # is not due for polling in the current cycle.
         self._data_cache: dict[str, Any] = {}
+        # Publish the cache before the first refresh so coordinator.data is
+        # always a dict; every refresh returns this same object
+        self.data = self._data_cache
 
         # Health check bookkeeping (updated by normal read cycle)
         self._last_health_ok: bool | None = None
@@ -214,7 +331,9 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             RuntimeError: If connection fails
         """
         if self._client is None:
-            # Create client based on connection type
+            # Create client based on connection type.  Each socket read/drain
+            # is bounded by op_timeout so a stalled PLC raises inside _retry
+            # (which drops the connection) instead of holding the poll.
             if self._local_tsap and self._remote_tsap:
                 self._client = pyS7.AsyncS7Client(
                     address=self._host,
@@ -223,6 +342,7 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
                     port=self._port,
                     connection_type=self._pys7_connection_type,
                     enable_metrics=self._enable_metrics,
+                    timeout=self._op_timeout,
                 )
             else:
                 self._client = pyS7.AsyncS7Client(
@@ -232,6 +352,7 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
                     port=self._port,
                     connection_type=self._pys7_connection_type,
                     enable_metrics=self._enable_metrics,
+                    timeout=self._op_timeout,
                 )
 
         if not self._client.is_connected:
@@ -423,27 +544,88 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             scan_interval: Custom scan interval (seconds), None for default
             real_precision: Decimal places for REAL values, None for full precision
         """
+        interval = self._normalize_scan_interval(scan_interval)
         async with self._async_lock:
-            self._items[topic] = address
-            self._item_scan_intervals[topic] = self._normalize_scan_interval(
-                scan_interval
-            )
-            if real_precision is None:
-                self._item_real_precisions.pop(topic, None)
-            else:
-                self._item_real_precisions[topic] = real_precision
-            self._item_next_read[topic] = time.monotonic()
-            self._invalidate_cache()
-            self._update_min_interval_locked()
+            if self._register_item_locked(topic, address, interval, real_precision):
+                self._invalidate_cache()
+                self._update_min_interval_locked()
+
+    async def add_items(
+        self, items: Iterable[tuple[str, str, float | int | None]]
+    ) -> None:
+        """Map several topics to PLC addresses and invalidate caches once.
+
+        Platforms registering many topics during setup use this instead of
+        one ``add_item`` call per topic, so the lock, cache invalidation and
+        polling interval update happen once for the whole list.
+
+        Args:
+            items: ``(topic, address, scan_interval)`` tuples; scan_interval
+                   may be None for the default
+        """
+        entries = [
+            (topic, address, self._normalize_scan_interval(scan_interval))
+            for topic, address, scan_interval in items
+        ]
+        if not entries:
+            return
+        async with self._async_lock:
+            changed = False
+            for topic, address, interval in entries:
+                if self._register_item_locked(topic, address, interval, None):
+                    changed = True
+            if changed:
+                self._invalidate_cache()
+                self._update_min_interval_locked()
+
+    def _register_item_locked(
+        self,
+        topic: str,
+        address: str,
+        interval: float,
+        real_precision: int | None,
+    ) -> bool:
+        """Record one topic registration and schedule it for an immediate read.
+
+        Returns:
+            False when the registration is identical to the existing one
+        """
+        # Entities sharing an address register the same topic; an
+        # identical registration leaves the plans and schedule intact.
+        if (
+            self._items.get(topic) == address
+            and self._item_scan_intervals.get(topic) == interval
+            and self._item_real_precisions.get(topic) == real_precision
+        ):
+            return False
+        self._items[topic] = address
+        self._item_scan_intervals[topic] = interval
+        if real_precision is None:
+            self._item_real_precisions.pop(topic, None)
+        else:
+            self._item_real_precisions[topic] = real_precision
+        now = time.monotonic()
+        self._item_next_read[topic] = now
+        heapq.heappush(self._due_heap, (now, topic))
+        return True
 
     def _invalidate_cache(self) -> None:
-        """Clear read and write plan caches.
+        """Clear read plan caches.
 
         Called when items are added or modified to ensure plans are rebuilt.
+        Parsed tags in ``_tag_cache`` only depend on the address string, so
+        they are kept and a rebuild only parses addresses it has not seen.
         """
         self._plans_batch.clear()
         self._plans_str.clear()
-        self._tag_cache.clear()
+        self._batch_groups = []
+        self._batch_tags = []
+        self._batch_dispatch = ()
+        self._batch_topics = None
+        self._batch_group_of = {}
+        self._all_plans_batch = ()
+        self._all_plans_str = ()
+        self._cache_valid = False
 
     def _build_tag_cache(self) -> None:
         """Build read plans for scalar and string tags.
@@ -458,6 +640,27 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         )
         self._plans_batch = {plan.topic: plan for plan in plans_batch}
         self._plans_str = {plan.topic: plan for plan in plans_str}
+        self._all_plans_batch = tuple(plans_batch)
+        self._all_plans_str = tuple(plans_str)
+        self._batch_groups = group_batch_plans(plans_batch)
+        self._batch_tags = [tag for tag, _ in self._batch_groups]
+        self._batch_dispatch = tuple(
+            (index, plan.topic, plan.postprocess)
+            for index, (_, group) in enumerate(self._batch_groups)
+            for plan in group
+        )
+        self._batch_topics = (
+            tuple(topic for _, topic, _ in self._batch_dispatch)
+            if len(self._batch_dispatch) == len(self._batch_groups)
+            and all(post is None for _, _, post in self._batch_dispatch)
+            else None
+        )
+        self._batch_group_of = {
+            plan.topic: (index, plan)
+            for index, (_, group) in enumerate(self._batch_groups)
+            for plan in group
+        }
+        self._cache_valid = True
 
     def _normalize_scan_interval(self, scan_interval: float | int | None) -> float:
         """Return a sanitized scan interval for an item.
@@ -506,6 +709,19 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         await asyncio.sleep(max(0.0, seconds))
 
+    def _client_read(self, tags: list[S7Tag], optimize: bool) -> Any:
+        """Read ``tags`` through the current client.
+
+        Passed to ``_retry`` with its arguments instead of a per-call lambda.
+        The method is looked up on each call rather than cached at connect
+        time; one attribute lookup is negligible next to the PLC round trip.
+        """
+        return self._client.read(tags, optimize=optimize)
+
+    def _client_write(self, tags: list[S7Tag], values: list[Any]) -> Any:
+        """Write ``values`` to ``tags`` through the current client."""
+        return self._client.write(tags, values)
+
     async def _retry(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """Execute ``func`` with retries using exponential backoff.
 
@@ -529,8 +745,11 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         while attempt <= self._max_retries:
             try:
-                # Ensure connection before each attempt
-                await self._ensure_connected()
+                # Ensure connection before each attempt; the inline check
+                # skips the coroutine call when the client is already up
+                client = self._client
+                if client is None or not client.is_connected:
+                    await self._ensure_connected()
                 result = func(*args, **kwargs)
                 if asyncio.iscoroutine(result):
                     return await result
@@ -539,35 +758,38 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # S7-specific communication errors (most common)
                 last_exc = e
                 error_category = "s7_communication"
-                _LOGGER.debug(
-                    "S7 communication error on attempt %s/%s: %s",
-                    attempt + 1,
-                    self._max_retries + 1,
-                    e,
-                )
+                if self._log_debug:
+                    _LOGGER.debug(
+                        "S7 communication error on attempt %s/%s: %s",
+                        attempt + 1,
+                        self._max_retries + 1,
+                        e,
+                    )
                 await self._drop_connection()
             except S7ReadResponseError as e:
                 # S7 response parsing errors
                 last_exc = e
                 error_category = "s7_response"
-                _LOGGER.debug(
-                    "S7 response error on attempt %s/%s: %s",
-                    attempt + 1,
-                    self._max_retries + 1,
-                    e,
-                )
+                if self._log_debug:
+                    _LOGGER.debug(
+                        "S7 response error on attempt %s/%s: %s",
+                        attempt + 1,
+                        self._max_retries + 1,
+                        e,
+                    )
                 await self._drop_connection()
             except OSError as e:
                 # Network/socket errors
                 last_exc = e
                 error_category = "network"
-                _LOGGER.debug(
-                    "Network error on attempt %s/%s: %s (errno: %s)",
-                    attempt + 1,
-                    self._max_retries + 1,
-                    e,
-                    getattr(e, "errno", "unknown"),
-                )
+                if self._log_debug:
+                    _LOGGER.debug(
+                        "Network error on attempt %s/%s: %s (errno: %s)",
+                        attempt + 1,
+                        self._max_retries + 1,
+                        e,
+                        getattr(e, "errno", "unknown"),
+                    )
                 await self._drop_connection()
             except struct.error as e:
                 # Data parsing errors (usually indicates protocol mismatch)
@@ -596,12 +818,13 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
                 # Generic runtime errors (catch-all for pyS7 issues)
                 last_exc = e
                 error_category = "runtime"
-                _LOGGER.debug(
-                    "Runtime error on attempt %s/%s: %s",
-                    attempt + 1,
-                    self._max_retries + 1,
-                    e,
-                )
+                if self._log_debug:
+                    _LOGGER.debug(
+                        "Runtime error on attempt %s/%s: %s",
+                        attempt + 1,
+                        self._max_retries + 1,
+                        e,
+                    )
                 await self._drop_connection()
 
             # Check if we should retry
@@ -609,14 +832,15 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
                 break
 
             # Exponential backoff
-            backoff = min(self._backoff_initial * (2**attempt), self._backoff_max)
-            _LOGGER.debug(
-                "Retrying after %.2fs backoff (attempt %s/%s, error: %s)",
-                backoff,
-                attempt + 1,
-                self._max_retries,
-                error_category,
-            )
+            backoff = self._backoff_schedule[attempt]
+            if self._log_debug:
+                _LOGGER.debug(
+                    "Retrying after %.2fs backoff (attempt %s/%s, error: %s)",
+                    backoff,
+                    attempt + 1,
+                    self._max_retries,
+                    error_category,
+                )
             await self._sleep(backoff)
             attempt += 1
 
@@ -648,7 +872,8 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Fetch data from PLC (called by DataUpdateCoordinator).
 
         Determines which tags are due for reading based on their individual
-        scan intervals, reads them via executor, and updates the cache.
+        scan intervals, reads them over the persistent async PLC connection
+        (no executor hop), and updates the cache.
         Updates health status based on read cycle outcome.
 
         Returns:
@@ -659,35 +884,45 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         start_time = time.monotonic()
         now = start_time
-
-        async with self._async_lock:
-            if not self._plans_batch and not self._plans_str:
-                self._build_tag_cache()
-            due_topics = [
-                topic for topic, due in self._item_next_read.items() if due <= now
-            ]
-
-            if not due_topics and not self._data_cache:
-                # First refresh without cached data: read all topics once.
-                due_topics = list(self._items.keys())
-                now = time.monotonic()
-                for topic in due_topics:
-                    self._item_next_read[topic] = now
-
+        self._log_debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
+        # The snapshot below and the bookkeeping after the read contain no
+        # await, so they run atomically on the event loop without taking
+        # _async_lock; the lock only serialises add_item registrations.
+        if not self._cache_valid:
+            self._build_tag_cache()
+        due_topics = self._pop_due_topics(now)
+
+        if not due_topics and not self._data_cache:
+            # First refresh without cached data: read all topics once.
+            due_topics = list(self._items.keys())
+            now = time.monotonic()
+            for topic in due_topics:
+                self._item_next_read[topic] = now
+
+        plans_batch: Sequence[TagPlan]
+        plans_str: Sequence[StringPlan]
+        if len(due_topics) == len(self._items):
+            # Everything is due: use the tuples published at build time
+            plans_batch = self._all_plans_batch
+            plans_str = self._all_plans_str
+        else:
+            plans_batch_map = self._plans_batch
+            plans_str_map = self._plans_str
             plans_batch = [
-                self._plans_batch[topic]
+                plans_batch_map[topic]
                 for topic in due_topics
-                if topic in self._plans_batch
+                if topic in plans_batch_map
             ]
             plans_str = [
-                self._plans_str[topic]
-                for topic in due_topics
-                if topic in self._plans_str
+                plans_str_map[topic] for topic in due_topics if topic in plans_str_map
             ]
 
+        # The cache is handed out as coordinator.data without copying;
+        # entities only read from it.
         if not plans_batch and not plans_str:
-            async with self._async_lock:
-                return dict(self._data_cache)
+            self._reschedule(due_topics)
+            return self._data_cache
 
         try:
             results = await self._read_all(plans_batch, plans_str)
@@ -703,18 +938,61 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             latency = round(time.monotonic() - start_time, 2)
             self._last_health_ok = False
             self._last_health_latency = latency
+            # Keep failed topics due so the next cycle retries them
+            self._reschedule(due_topics, retry=True)
+            raise
+        except BaseException:
+            # Cancelled polls and unexpected errors must also put the popped
+            # topics back, otherwise they would never be due again
+            self._reschedule(due_topics, retry=True)
             raise
 
-        async with self._async_lock:
-            read_time = time.monotonic()
-            for topic in due_topics:
-                interval = self._item_scan_intervals.get(
-                    topic, self._default_scan_interval
-                )
-                interval = max(interval, self._MIN_SCAN_INTERVAL)
-                self._item_next_read[topic] = read_time + interval
-            self._data_cache.update(results)
-            return dict(self._data_cache)
+        self._reschedule(due_topics)
+        self._data_cache.update(results)
+        return self._data_cache
+
+    def _pop_due_topics(self, now: float) -> list[str]:
+        """Pop every topic whose next read time is at or before ``now``.
+
+        Only the due entries are visited (O(k log N)) instead of scanning all
+        items. Entries that no longer match ``_item_next_read`` are stale
+        (the topic was re-added or rescheduled) and are dropped.
+        """
+        heap = self._due_heap
+        next_read = self._item_next_read
+        due: dict[str, None] = {}
+        while heap and heap[0][0] <= now:
+            when, topic = heapq.heappop(heap)
+            if next_read.get(topic) == when:
+                due[topic] = None
+        return list(due)
+
+    def _reschedule(self, topics: list[str], retry: bool = False) -> None:
+        """Push ``topics`` back on the due heap.
+
+        Args:
+            topics: Topics popped for the current cycle
+            retry: Keep the current due time instead of advancing by the
+                topic's scan interval (used after a failed read)
+        """
+        heap = self._due_heap
+        next_read = self._item_next_read
+        if retry:
+            for topic in topics:
+                when = next_read.get(topic)
+                if when is not None:
+                    heapq.heappush(heap, (when, topic))
+            return
+
+        # Stored intervals are already clamped to _MIN_SCAN_INTERVAL by
+        # _normalize_scan_interval, so no per-topic max() is needed here.
+        read_time = time.monotonic()
+        intervals = self._item_scan_intervals
+        default = self._default_scan_interval
+        for topic in topics:
+            when = read_time + intervals.get(topic, default)
+            next_read[topic] = when
+            heapq.heappush(heap, (when, topic))
 
     async def _read_s7_string(
         self, db: int, start: int, length: int, is_wstring: bool = False
@@ -736,50 +1014,67 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         Returns:
             Decoded string content
         """
-        data_type = DataType.WSTRING if is_wstring else DataType.STRING
-        # Use the length declared in the tag (e.g., S308.50 -> length=50)
-        tag = S7Tag(MemoryArea.DB, db, data_type, start, 0, length)
+        # Use the length declared in the tag (e.g., S308.50 -> length=50).
+        # Tags are immutable, so each distinct string is built only once.
+        key = (db, start, length, is_wstring)
+        tag = self._string_tags.get(key)
+        if tag is None:
+            data_type = DataType.WSTRING if is_wstring else DataType.STRING
+            tag = S7Tag(MemoryArea.DB, db, data_type, start, 0, length)
+            self._string_tags[key] = tag
 
         # pyS7 handles header parsing, data reading, and decoding
-        result = await self._retry(
-            lambda: self._client.read([tag], optimize=self._optimize_read)
-        )
+        result = await self._retry(self._client_read, [tag], self._optimize_read)
         value = result[0]
 
-        _LOGGER.debug(
-            "Read S7 %s DB%d.%d value=%s optimize=%s",
-            "WSTRING" if is_wstring else "STRING",
-            db,
-            start,
-            repr(value[:50] if len(value) > 50 else value) if value else value,
-            self._optimize_read,
-        )
+        if self._log_debug:
+            _LOGGER.debug(
+                "Read S7 %s DB%d.%d value=%s optimize=%s",
+                "WSTRING" if is_wstring else "STRING",
+                db,
+                start,
+                repr(value[:50] if len(value) > 50 else value) if value else value,
+                self._optimize_read,
+            )
 
         return value if isinstance(value, str) else str(value)
 
-    def _tag_key(self, tag: S7Tag) -> tuple[Any, ...]:
-        """Generate a unique key for tag deduplication.
-
-        Args:
-            tag: S7Tag instance to generate key for
+    def _due_batch_groups(
+        self, plans_batch: Sequence[TagPlan]
+    ) -> list[tuple[S7Tag, list[TagPlan]]]:
+        """Return the prebuilt tag groups covering ``plans_batch``.
 
-        Returns:
-            Tuple of tag attributes that uniquely identify it
+        Plans that are not part of the built cache (ad-hoc callers) are
+        grouped on the fly instead.
         """
-        return (
-            tag.memory_area,
-            tag.db_number,
-            tag.data_type,
-            tag.start,
-            tag.bit_offset,
-            tag.length,
-        )
+        group_of = self._batch_group_of
+        picked: dict[int, None] = {}
+        for plan in plans_batch:
+            entry = group_of.get(plan.topic)
+            if entry is None or entry[1] is not plan:
+                return group_batch_plans(plans_batch)
+            picked[entry[0]] = None
+        batch_groups = self._batch_groups
+        if len(picked) == len(batch_groups):
+            # Every group is due (the common single-interval case)
+            return batch_groups
+        return [batch_groups[index] for index in picked]
+
+    async def _read_batch(
+        self,
+        plans_batch: Sequence[TagPlan],
+        plans_str: Sequence[StringPlan] = (),
+    ) -> dict[str, Any]:
+        """Read scalar and string tags in one batch.
 
-    async def _read_batch(self, plans_batch: list[TagPlan]) -> dict[str, Any]:
-        """Read scalar tags in batch handling deduplication and post-processing.
+        Scalar tags are deduplicated and post-processed. Each ``StringPlan``
+        carries a prebuilt STRING/WSTRING tag (header and body as one item)
+        which rides along in the same request, so pyS7 packs every due tag
+        into as few PDUs as fit instead of one round-trip per string.
 
         Args:
             plans_batch: List of TagPlan objects for scalar reads
+            plans_str: List of StringPlan objects for string reads
 
         Returns:
             Dictionary mapping topic names to their read values
@@ -788,32 +1083,58 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             OSError, RuntimeError, S7 errors: On communication failures
         """
         results: dict[str, Any] = {}
-        if not plans_batch:
+        if not plans_batch and not plans_str:
             return results
 
-        groups: dict[tuple, list[TagPlan]] = {}
-        order: list[tuple] = []
-        for plan in plans_batch:
-            k = self._tag_key(plan.tag)
-            if k not in groups:
-                groups[k] = []
-                order.append(k)
-            groups[k].append(plan)
+        groups = self._due_batch_groups(plans_batch) if plans_batch else []
+
+        tags: list[S7Tag]
+        pooled = False
+        if groups is self._batch_groups and not plans_str:
+            # Every scalar is due and no string rides along: hand the list
+            # built at cache time straight to the client (pyS7 copies it)
+            tags = self._batch_tags
+        else:
+            # Reuse the instance scratch list unless another batch read is
+            # in flight (the read awaits), in which case allocate locally
+            pooled = not self._scratch_busy
+            if pooled:
+                self._scratch_busy = True
+                tags = self._scratch_tags
+            else:
+                tags = []
 
+            if groups is self._batch_groups:
+                tags.extend(self._batch_tags)
+            else:
+                tags.extend(tag for tag, _ in groups)
+            tags.extend(plan.tag for plan in plans_str)
         try:
-            tags = [groups[k][0].tag for k in order]
             # Changed in pyS7 1.5.0 optimized=True by default
-            values = await self._retry(
-                lambda: self._client.read(tags, optimize=self._optimize_read)
-            )
-            _LOGGER.debug(
-                "Batch read %d tags optimize=%s", len(tags), self._optimize_read
-            )
-            for k, v in zip(order, values):
-                for plan in groups[k]:
-                    results[plan.topic] = plan.postprocess(v) if plan.postprocess else v
+            values = await self._retry(self._client_read, tags, self._optimize_read)
+            if self._log_debug:
+                _LOGGER.debug(
+                    "Batch read %d tags (%d strings) optimize=%s",
+                    len(tags),
+                    len(plans_str),
+                    self._optimize_read,
+                )
+            if groups is not self._batch_groups:
+                for (_, group), v in zip(groups, values):
+                    for plan in group:
+                        post = plan.postprocess
+                        results[plan.topic] = post(v) if post else v
+            elif self._batch_topics is not None:
+                # zip stops at the last scalar; string values follow
+                results.update(zip(self._batch_topics, values))
+            else:
+                for index, topic, post in self._batch_dispatch:
+                    v = values[index]
+                    results[topic] = post(v) if post else v
+            for plan, v in zip(plans_str, values[len(groups) :]):
+                results[plan.topic] = v if isinstance(v, str) else str(v)
         except (OSError, RuntimeError) as err:
-            _LOGGER.error("Batch read failed for %d tags: %s", len(plans_batch), err)
+            _LOGGER.error("Batch read failed for %d tags: %s", len(tags), err)
             raise
         except (
             S7CommunicationError,
@@ -822,67 +1143,18 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         ) as err:
             _LOGGER.error(
                 "S7 communication error during batch read of %d tags: %s",
-                len(plans_batch),
+                len(tags),
                 err,
             )
             raise
-        return results
-
-    async def _read_strings(
-        self, plans_str: list[StringPlan], deadline: float
-    ) -> dict[str, Any]:
-        """Read strings respecting an absolute deadline.
-
-        Args:
-            plans_str: List of StringPlan objects for string reads
-            deadline: Absolute monotonic timestamp to stop reading
-
-        Returns:
-            Dictionary mapping topic names to their string values
-
-        Raises:
-            UpdateFailed: On timeout or communication failures
-        """
-        results: dict[str, Any] = {}
-        for plan in plans_str:
-            if time.monotonic() > deadline:
-                _LOGGER.warning("String read timeout reached (%.2fs)", self._op_timeout)
-                raise UpdateFailed(
-                    f"String read timeout reached ({self._op_timeout:.2f}s)"
-                )
-            try:
-                results[plan.topic] = await self._read_s7_string(
-                    plan.db, plan.start, plan.length, plan.is_wstring
-                )
-            except (
-                S7CommunicationError,
-                S7ConnectionError,
-                S7ReadResponseError,
-            ) as err:
-                _LOGGER.error(
-                    "String read error: "
-                    "S7 communication error reading %s (DB%d.%d): %s",
-                    plan.topic,
-                    plan.db,
-                    plan.start,
-                    err,
-                )
-                raise UpdateFailed(
-                    f"S7 error reading string {plan.topic}: {err}"
-                ) from err
-            except (OSError, RuntimeError) as err:
-                _LOGGER.error(
-                    "String read error: Network/runtime error reading %s (DB%d.%d): %s",
-                    plan.topic,
-                    plan.db,
-                    plan.start,
-                    err,
-                )
-                raise UpdateFailed(f"Error reading string {plan.topic}: {err}") from err
+        finally:
+            if pooled:
+                tags.clear()
+                self._scratch_busy = False
         return results
 
     async def _read_all(
-        self, plans_batch: list[TagPlan], plans_str: list[StringPlan]
+        self, plans_batch: Sequence[TagPlan], plans_str: Sequence[StringPlan]
     ) -> dict[str, Any]:
         """Read all planned tags.
 
@@ -896,32 +1168,27 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: On connection or read failures
         """
+        # Nothing due: do not (re)connect to the PLC just to read nothing
+        if not plans_batch and not plans_str:
+            return {}
+
         try:
             await self._ensure_connected()
         except (OSError, RuntimeError) as err:
             _LOGGER.error("Connection failed: %s", err)
             raise UpdateFailed(f"Connection failed: {err}") from err
 
-        start_ts = time.monotonic()
-        deadline = start_ts + self._op_timeout
-
-        results: dict[str, Any] = {}
+        deadline_ns = time.monotonic_ns() + self._op_timeout_ns
 
         try:
-            # ===== 1) Scalar batch with dedup & optimize =====
-            if plans_batch:
-                results.update(await self._read_batch(plans_batch))
-
-            # ===== 2) Strings (with deadline) =====
-            if plans_str:
-                results.update(await self._read_strings(plans_str, deadline))
+            # ===== 1) Scalars (dedup) and strings in a single batch =====
+            # Strings share the request, so every due topic has a value
+            # once this returns and no placeholders need filling in.
+            results = await self._read_batch(plans_batch, plans_str)
 
-            # ===== 3) Timeout check after batch =====
-            if time.monotonic() > deadline:
+            # ===== 2) Timeout check after batch =====
+            if time.monotonic_ns() > deadline_ns:
                 _LOGGER.warning("Batch read timeout reached (%.2fs)", self._op_timeout)
-                for plan in plans_str:
-                    results.setdefault(plan.topic, None)
-                return results
 
         except (
             OSError,
@@ -999,15 +1266,15 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
 
         # Batching enabled: accumulate writes
         waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
-        async with self._async_lock:
-            # Add to buffer
-            self._write_batch_buffer[address] = value
-            self._write_batch_waiters.setdefault(address, []).append(waiter)
-
-            # Cancel existing timer if any
-            if self._write_batch_timer is not None:
-                self._write_batch_timer.cancel()
-
+        # Buffering contains no await, so it runs atomically on the event
+        # loop without taking _async_lock.
+        self._write_batch_buffer[address] = value
+        self._write_batch_waiters.setdefault(address, []).append(waiter)
+
+        # The window opens with the first buffered write and is not
+        # extended by later ones, so a steady stream of writes cannot
+        # postpone the flush indefinitely.
+        if self._write_batch_timer is None:
             # Schedule flush after delay (check loop exists for shutdown safety)
             if self.hass.loop is not None:
                 self._write_batch_timer = self.hass.loop.call_later(
@@ -1036,16 +1303,15 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _flush_write_batch(self) -> None:
         """Flush accumulated writes to PLC using write_multi."""
-        async with self._async_lock:
-            if not self._write_batch_buffer:
-                return
+        # Swap out the buffer without awaiting (atomic on the event loop)
+        if not self._write_batch_buffer:
+            return
 
-            # Get buffered writes
-            writes = list(self._write_batch_buffer.items())
-            waiters = self._write_batch_waiters
-            self._write_batch_buffer.clear()
-            self._write_batch_waiters = {}
-            self._write_batch_timer = None
+        writes = list(self._write_batch_buffer.items())
+        waiters = self._write_batch_waiters
+        self._write_batch_buffer.clear()
+        self._write_batch_waiters = {}
+        self._write_batch_timer = None
 
         results: dict[str, bool] = {}
         # Execute batch write
@@ -1143,7 +1409,7 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         """
         try:
             await self._ensure_connected()
-            await self._retry(lambda: self._client.write([tag], [payload]))
+            await self._retry(self._client_write, [tag], [payload])
             return True
         except (
             OSError,
@@ -1179,32 +1445,24 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
             tag = self._get_or_parse_tag(address)
 
             # Handle STRING types (CHAR array, STRING, WSTRING)
-            if tag.data_type == DataType.CHAR and getattr(tag, "length", 1) > 1:
-                return await self._read_s7_string(
-                    tag.db_number, tag.start, tag.length, is_wstring=False
-                )
-            elif tag.data_type == DataType.STRING:
-                return await self._read_s7_string(
-                    tag.db_number, tag.start, tag.length, is_wstring=False
-                )
-            elif tag.data_type == DataType.WSTRING:
+            is_wstring = _STRING_READS.get(tag.data_type)
+            if is_wstring is None and tag.data_type == DataType.CHAR:
+                if getattr(tag, "length", 1) > 1:
+                    is_wstring = False
+            if is_wstring is not None:
                 return await self._read_s7_string(
-                    tag.db_number, tag.start, tag.length, is_wstring=True
+                    tag.db_number, tag.start, tag.length, is_wstring=is_wstring
                 )
 
             # Changed in pyS7 1.5.0 optimized=True by default
-            value = (
-                await self._retry(
-                    lambda: self._client.read([tag], optimize=self._optimize_read)
-                )
-            )[0]
+            result = await self._retry(self._client_read, [tag], self._optimize_read)
+            value = result[0]
             _LOGGER.debug(
                 "Read single tag %s optimize=%s", address, self._optimize_read
             )
-            # Normalize BIT to bool
-            if tag.data_type == DataType.BIT:
-                return bool(value)
-            return apply_postprocess(tag.data_type, value)
+            # Normalize BIT to bool, round REALs; other types pass through
+            post = _SINGLE_READ_POST.get(tag.data_type)
+            return post(value) if post is not None else value
         except (
             OSError,
             RuntimeError,
@@ -1259,45 +1517,9 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             ValueError: If value type doesn't match the tag data type.
         """
-        if tag.data_type == DataType.BIT:
-            if not isinstance(value, bool):
-                raise ValueError(
-                    f"BIT address {address} requires bool value, "
-                    f"got {type(value).__name__}"
-                )
-            return bool(value)
-
-        if tag.data_type in (DataType.STRING, DataType.WSTRING):
-            if not isinstance(value, str):
-                raise ValueError(
-                    f"STRING/WSTRING address {address} requires str value, "
-                    f"got {type(value).__name__}"
-                )
-            return str(value)
-
-        if tag.data_type in (DataType.REAL, DataType.LREAL):
-            if not isinstance(value, (int, float)):
-                raise ValueError(
-                    f"{tag.data_type.name} address {address} requires numeric value, "
-                    f"got {type(value).__name__}"
-                )
-            return float(value)
-
-        if tag.data_type in (
-            DataType.BYTE,
-            DataType.WORD,
-            DataType.DWORD,
-            DataType.INT,
-            DataType.DINT,
-            DataType.USINT,
-            DataType.SINT,
-        ):
-            if not isinstance(value, (int, float)):
-                raise ValueError(
-                    f"{tag.data_type.name} address {address} requires "
-                    f"numeric value, got {type(value).__name__}"
-                )
-            return int(round(float(value)))
+        coerce = _PAYLOAD_COERCERS.get(tag.data_type)
+        if coerce is not None:
+            return coerce(tag, value, address)
 
         if tag.data_type == DataType.CHAR:
             raise ValueError(
@@ -1357,7 +1579,7 @@ class S7Coordinator(DataUpdateCoordinator[dict[str, Any]]):
         if tags:
             try:
                 await self._ensure_connected()
-                await self._retry(lambda: self._client.write(tags, payloads))
+                await self._retry(self._client_write, tags, payloads)
                 # Mark all as successful
                 for addr in addresses:
                     results[addr] = True
@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections.abc import Callable
+from typing import Any
 
 from homeassistant.components.cover import (
     CoverDeviceClass,
@@ -14,7 +15,6 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.helpers.event import async_call_later
 
 from .const import (
     CONF_AREA,
@@ -49,6 +49,8 @@ async def async_setup_entry(
     coord, device_info, device_id = get_coordinator_and_device_info(entry)
 
     entities: list[S7Cover | S7PositionCover] = []
+    # (topic, address, scan_interval) registered in one call after the loop
+    topics: list[tuple[str, str, float | int | None]] = []
 
     for item in entry.options.get(CONF_COVERS, []):
         # Check if this is a position-based cover
@@ -64,7 +66,7 @@ async def async_setup_entry(
             stop_pulse = item.get(CONF_STOP_PULSE_DURATION, DEFAULT_PULSE_DURATION)
 
             position_topic = f"cover:position:{position_state}"
-            await coord.add_item(position_topic, position_state, scan_interval)
+            topics.append((position_topic, position_state, scan_interval))
 
             name = item.get(CONF_NAME) or default_entity_name(position_state)
             unique_id = f"{device_id}:{position_topic}"
@@ -110,11 +112,11 @@ async def async_setup_entry(
 
         if opened_state:
             opened_topic = f"cover:opened:{opened_state}"
-            await coord.add_item(opened_topic, opened_state, scan_interval)
+            topics.append((opened_topic, opened_state, scan_interval))
 
         if closed_state:
             closed_topic = f"cover:closed:{closed_state}"
-            await coord.add_item(closed_topic, closed_state, scan_interval)
+            topics.append((closed_topic, closed_state, scan_interval))
 
         name = item.get(CONF_NAME) or default_entity_name(open_command)
         unique_topic = opened_topic or closed_topic or f"cover:command:{open_command}"
@@ -151,6 +153,9 @@ async def async_setup_entry(
             )
         )
 
+    if topics:
+        await coord.add_items(topics)
+
     if entities:
         async_add_entities(entities)
         await coord.async_request_refresh()
@@ -195,6 +200,7 @@ class S7Cover(S7BaseEntity, CoverEntity):
         self._closed_state_address = closed_state  # Finecorsa chiuso
         self._opened_topic = opened_topic
         self._closed_topic = closed_topic
+        self._state_topics = tuple(t for t in (opened_topic, closed_topic) if t)
         self._operate_time = max(float(operate_time), 0.0)
         self._use_state_topics = use_state_topics
         self._reset_handles: dict[str, Callable[[], None]] = {}
@@ -208,24 +214,25 @@ class S7Cover(S7BaseEntity, CoverEntity):
                 self._attr_device_class = CoverDeviceClass(device_class)
             except ValueError:
                 _LOGGER.warning("Invalid device class %s", device_class)
-
-    def _get_topic_state(self, topic: str | None) -> bool | None:
-        if topic is None:
-            return None
-        data = self.coordinator.data or {}
-        if topic not in data:
-            return None
-        value = data.get(topic)
-        if value is None:
-            return None
-        return bool(value)
+        # Addresses and timings never change after setup, so the attribute
+        # strings are formatted once instead of on every state write
+        self._static_attrs = self._build_static_attrs()
+
+    def _get_states(self) -> tuple[bool | None, bool | None]:
+        """Return the (opened, closed) limit switch states."""
+        data = self.coordinator.data
+        opened = data.get(self._opened_topic) if self._opened_topic else None
+        closed = data.get(self._closed_topic) if self._closed_topic else None
+        return (
+            None if opened is None else bool(opened),
+            None if closed is None else bool(closed),
+        )
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
         # If using state topics (limit switches), check if movement should stop
-        if self._use_state_topics:
-            opened_state = self._get_topic_state(self._opened_topic)
-            closed_state = self._get_topic_state(self._closed_topic)
+        if self._use_state_topics and (self._is_opening or self._is_closing):
+            opened_state, closed_state = self._get_states()
 
             # If opening and reached open position, stop
             if self._is_opening and opened_state is True:
@@ -243,11 +250,8 @@ class S7Cover(S7BaseEntity, CoverEntity):
     def available(self) -> bool:
         if not self.coordinator.is_connected():
             return False
-        topics = [t for t in (self._opened_topic, self._closed_topic) if t]
-        if not topics:
-            return True
-        data = self.coordinator.data or {}
-        return all((topic in data and data[topic] is not None) for topic in topics)
+        data = self.coordinator.data
+        return all(data.get(topic) is not None for topic in self._state_topics)
 
     @property
     def is_opening(self) -> bool:
@@ -263,8 +267,7 @@ class S7Cover(S7BaseEntity, CoverEntity):
     def is_closed(self) -> bool | None:
         if self._use_state_topics:
             # Use state topics for position feedback
-            closed_state = self._get_topic_state(self._closed_topic)
-            opened_state = self._get_topic_state(self._opened_topic)
+            opened_state, closed_state = self._get_states()
 
             # Closed topic is True → cover is closed
             if closed_state is True and opened_state is not True:
@@ -285,6 +288,11 @@ class S7Cover(S7BaseEntity, CoverEntity):
             # Return last known/assumed position
             return self._assumed_closed
 
+    # Starting or stopping a movement publishes the new motion state with
+    # async_write_ha_state and does not request a refresh: the limit switches
+    # cannot have moved at that instant.  _complete_operation still refreshes,
+    # since after operate_time the end switch has most likely changed.
+
     async def async_open_cover(self, **kwargs) -> None:
         await self._ensure_connected()
         await self._stop_operation("close")
@@ -295,7 +303,6 @@ class S7Cover(S7BaseEntity, CoverEntity):
             self._assumed_closed = False  # Assume open when opening starts
         self._schedule_reset("open")
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
 
     async def async_close_cover(self, **kwargs) -> None:
         await self._ensure_connected()
@@ -307,7 +314,6 @@ class S7Cover(S7BaseEntity, CoverEntity):
             self._assumed_closed = True  # Assume closed when closing starts
         self._schedule_reset("close")
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
 
     async def async_stop_cover(self, **kwargs) -> None:
         """Stop the cover movement."""
@@ -341,11 +347,22 @@ class S7Cover(S7BaseEntity, CoverEntity):
         self._is_opening = False
         self._is_closing = False
         self.async_write_ha_state()
-        await self.coordinator.async_request_refresh()
 
     @property
     def extra_state_attributes(self):
-        attrs = {}
+        attrs = dict(self._static_attrs)
+        if self._opened_topic:
+            interval = self.coordinator.get_scan_interval(self._opened_topic)
+            attrs["opened_scan_interval"] = f"{interval} s"
+        if self._closed_topic:
+            interval = self.coordinator.get_scan_interval(self._closed_topic)
+            attrs["closed_scan_interval"] = f"{interval} s"
+
+        return attrs
+
+    def _build_static_attrs(self) -> dict[str, Any]:
+        """Return the attributes that are fixed once the entity is set up."""
+        attrs: dict[str, Any] = {}
         if self._open_command_address:
             attrs["s7_open_command_address"] = self._open_command_address.upper()
         if self._close_command_address:
@@ -358,15 +375,8 @@ class S7Cover(S7BaseEntity, CoverEntity):
             attrs["state_topics_used"] = True
         else:
             attrs["state_topics_used"] = False
-        if self._opened_topic:
-            interval = self.coordinator.get_scan_interval(self._opened_topic)
-            attrs["opened_scan_interval"] = f"{interval} s"
-        if self._closed_topic:
-            interval = self.coordinator.get_scan_interval(self._closed_topic)
-            attrs["closed_scan_interval"] = f"{interval} s"
         attrs["operate_time"] = f"{self._operate_time:.1f} s"
         attrs["cover_type"] = "open/close"
-
         return attrs
 
     def _cancel_reset(self, direction: str) -> None:
@@ -385,13 +395,14 @@ class S7Cover(S7BaseEntity, CoverEntity):
             return
 
         @callback
-        def _callback(_now) -> None:
+        def _callback() -> None:
             self._reset_handles.pop(direction, None)
             self.hass.async_create_task(_async_reset())
 
-        self._reset_handles[direction] = async_call_later(
-            self.hass, self._operate_time, _callback
-        )
+        # The operate time is a relative delay, so the loop's monotonic timer
+        # is enough; async_call_later would also fetch wall-clock time
+        handle = self.hass.loop.call_later(self._operate_time, _callback)
+        self._reset_handles[direction] = handle.cancel
 
     async def _stop_operation(self, direction: str) -> None:
         self._cancel_reset(direction)
@@ -488,13 +499,11 @@ class S7PositionCover(S7BaseEntity, CoverEntity):
                 self._attr_device_class = CoverDeviceClass(device_class)
             except ValueError:
                 _LOGGER.warning("Invalid device class %s", device_class)
+        self._static_attrs = self._build_static_attrs()
 
     def _get_position_value(self) -> int | None:
         """Get the current position value from coordinator data."""
-        data = self.coordinator.data or {}
-        if self._position_topic not in data:
-            return None
-        value = data.get(self._position_topic)
+        value = self.coordinator.data.get(self._position_topic)
         if value is None:
             return None
         try:
@@ -512,8 +521,7 @@ class S7PositionCover(S7BaseEntity, CoverEntity):
     def available(self) -> bool:
         if not self.coordinator.is_connected():
             return False
-        data = self.coordinator.data or {}
-        return self._position_topic in data and data[self._position_topic] is not None
+        return self.coordinator.data.get(self._position_topic) is not None
 
     @property
     def current_cover_position(self) -> int | None:
@@ -600,7 +608,14 @@ class S7PositionCover(S7BaseEntity, CoverEntity):
 
     @property
     def extra_state_attributes(self):
-        attrs = {}
+        attrs = dict(self._static_attrs)
+        interval = self.coordinator.get_scan_interval(self._position_topic)
+        attrs["closed_scan_interval"] = f"{interval} s"
+        return attrs
+
+    def _build_static_attrs(self) -> dict[str, Any]:
+        """Return the attributes that are fixed once the entity is set up."""
+        attrs: dict[str, Any] = {}
         if self._position_state_address:
             attrs["s7_position_state_address"] = self._position_state_address.upper()
         if self._position_command_address:
@@ -610,7 +625,5 @@ class S7PositionCover(S7BaseEntity, CoverEntity):
         if self._stop_command_address:
             attrs["s7_stop_command_address"] = self._stop_command_address.upper()
             attrs["stop_pulse_duration"] = f"{self._stop_pulse_duration} s"
-        interval = self.coordinator.get_scan_interval(self._position_topic)
-        attrs["closed_scan_interval"] = f"{interval} s"
         attrs["cover_type"] = "position"
         return attrs
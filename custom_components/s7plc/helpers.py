@@ -152,6 +152,11 @@ def get_coordinator_and_device_info(
     return coordinator, device_info, device_id
 
 
+# Runs of anything but letters, digits and dots. A maximal run is replaced by
+# one space, so no second pass is needed to collapse whitespace.
+_NON_ADDRESS_CHARS_RE = re.compile(r"[^0-9A-Za-z.]+")
+
+
 def default_entity_name(address: str | None) -> str | None:
     """Return a default entity name using a humanized address.
 
@@ -161,8 +166,7 @@ def default_entity_name(address: str | None) -> str | None:
     """
 
     if address:
-        humanized = re.sub(r"[^0-9A-Za-z\.]+", " ", address)
-        humanized = re.sub(r"\s+", " ", humanized).strip()
+        humanized = _NON_ADDRESS_CHARS_RE.sub(" ", address).strip()
         return humanized.upper()
 
     return None
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Any, Callable
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Sequence
 
-from .address import DataType, S7Tag, parse_tag
+from .address import DataType, MemoryArea, S7Tag, parse_tag
 from .const import DEFAULT_REAL_PRECISION
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TagPlan:
     """Plan for a single scalar tag."""
 
@@ -21,7 +22,7 @@ class TagPlan:
     postprocess: Callable[[Any], Any] | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StringPlan:
     """Plan for an S7 string."""
 
@@ -30,6 +31,27 @@ class StringPlan:
     start: int
     length: int
     is_wstring: bool = False
+    tag: S7Tag = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Header and body are fetched together as a single STRING/WSTRING item
+        object.__setattr__(
+            self,
+            "tag",
+            S7Tag(
+                MemoryArea.DB,
+                self.db,
+                DataType.WSTRING if self.is_wstring else DataType.STRING,
+                self.start,
+                0,
+                self.length,
+            ),
+        )
+
+
+_REAL_TYPES = frozenset(
+    dt for dt in (DataType.REAL, getattr(DataType, "LREAL", None)) if dt is not None
+)
 
 
 def apply_postprocess(
@@ -37,13 +59,53 @@ def apply_postprocess(
 ):
     """Apply basic post-processing based on the tag data type."""
 
-    if data_type not in (DataType.REAL, getattr(DataType, "LREAL", None)):
+    if data_type not in _REAL_TYPES:
         return value
     if precision is None:
         return value
     return round(value, precision)
 
 
+# One shared rounding callable per precision instead of a closure per plan
+_ROUNDERS: dict[int, Callable[[Any], Any]] = {}
+
+
+def _mk_post(data_type, precision: int | None) -> Callable[[Any], Any] | None:
+    """Resolve the post-processor for a scalar plan once, at build time.
+
+    Returns ``None`` when values pass through unchanged so the poll loop can
+    skip the call entirely.
+    """
+
+    if data_type not in _REAL_TYPES or precision is None:
+        return None
+    rounder = _ROUNDERS.get(precision)
+    if rounder is None:
+        rounder = _ROUNDERS[precision] = partial(round, ndigits=precision)
+    return rounder
+
+
+def group_batch_plans(
+    plans_batch: Sequence[TagPlan],
+) -> list[tuple[S7Tag, list[TagPlan]]]:
+    """Group scalar plans that read the same tag, in first-occurrence order.
+
+    Each group is read once and its value dispatched to every plan in it.
+    ``S7Tag`` is a frozen dataclass that hashes and compares by its fields,
+    so the tag itself is the dedup key.
+    """
+
+    groups: dict[S7Tag, tuple[S7Tag, list[TagPlan]]] = {}
+    for plan in plans_batch:
+        tag = plan.tag
+        group = groups.get(tag)
+        if group is None:
+            groups[tag] = (tag, [plan])
+        else:
+            group[1].append(plan)
+    return list(groups.values())
+
+
 def build_plans(
     items: dict[str, str],
     *,
@@ -97,9 +159,6 @@ def build_plans(
             )
             continue
 
-        def _mk_post(dt, precision):
-            return lambda v: apply_postprocess(dt, v, precision=precision)
-
         precision = DEFAULT_REAL_PRECISION
         if precisions is not None and topic in precisions:
             precision = precisions[topic]
@@ -1185,6 +1185,12 @@ class DummyCoordinator:
         self.add_item_calls.append((args, kwargs))
         return None
 
+    async def add_items(self, items):
+        """Track add_items calls one entry per registered topic."""
+        for item in items:
+            self.add_item_calls.append((tuple(item), {}))
+        return None
+
     async def write(self, address: str, value: bool | int | float | str) -> bool:
         self.write_calls.append(("write", address, value))
         if self._write_queue:
@@ -1346,6 +1352,25 @@ class DummyTag:
         self.bit_offset = bit_offset
         self.length = length
 
+    def _key(self):
+        return (
+            self.memory_area,
+            self.db_number,
+            self.data_type,
+            self.start,
+            self.bit_offset,
+            self.length,
+        )
+
+    # Compare and hash by fields, like pyS7's frozen S7Tag dataclass
+    def __eq__(self, other):
+        if not isinstance(other, DummyTag):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
 
 # ============================================================================
 # Shared Fixtures
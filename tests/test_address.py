@@ -34,6 +34,12 @@ def test_parse_tag_invalid_address():
         assert False, "Expected ValueError was not raised"
 
 
+def test_parse_tag_memoizes_by_address():
+    """``parse_tag`` returns the same tag instance for a repeated address"""
+
+    assert address.parse_tag("DB1,W20") is address.parse_tag("DB1,W20")
+
+
 def test_get_numeric_limits():
     """``get_numeric_limits``"""
 
@@ -9,6 +9,7 @@ import asyncio
 from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.s7plc import coordinator
+from custom_components.s7plc import plans as plans_module
 from custom_components.s7plc.coordinator import S7Coordinator
 from custom_components.s7plc.plans import StringPlan, TagPlan
 from conftest import DummyTag
@@ -91,6 +92,37 @@ async def test_retry_retries_until_success(coord_factory):
     assert sleep_calls == [coord._backoff_initial]
 
 
+@pytest.mark.asyncio
+async def test_retry_skips_ensure_when_client_connected(coord_factory):
+    """Test _retry only calls _ensure_connected when the client is down."""
+    coord = coord_factory()
+    ensure_calls = 0
+
+    async def fake_ensure():
+        nonlocal ensure_calls
+        ensure_calls += 1
+
+    class Client:
+        is_connected = True
+
+    coord._ensure_connected = fake_ensure
+    coord._client = Client()
+
+    assert await coord._retry(lambda: "ok") == "ok"
+    assert ensure_calls == 0
+
+    Client.is_connected = False
+    assert await coord._retry(lambda: "ok") == "ok"
+    assert ensure_calls == 1
+
+
+def test_backoff_schedule_doubles_up_to_max(coord_factory):
+    """Test the precomputed backoff schedule doubles and is capped."""
+    coord = coord_factory(max_retries=4, backoff_initial=0.5, backoff_max=2.0)
+
+    assert coord._backoff_schedule == (0.5, 1.0, 2.0, 2.0)
+
+
 @pytest.mark.asyncio
 async def test_retry_raises_after_exhaustion(coord_factory):
     """Test retry mechanism raises after exhausting retries."""
@@ -158,8 +190,8 @@ async def test_read_batch_deduplicates_tags(coord_factory, dummy_tag, dummy_clie
     client = dummy_client([[10, 5]])
     coord._client = client
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
 
@@ -173,6 +205,76 @@ async def test_read_batch_deduplicates_tags(coord_factory, dummy_tag, dummy_clie
     }
 
 
+@pytest.mark.asyncio
+async def test_read_batch_reuses_scratch_containers(coord_factory, dummy_tag):
+    """Test batch reads reuse the pooled containers and release them."""
+    coord = coord_factory()
+    plans = [TagPlan("topic/a", dummy_tag(data_type=coordinator.DataType.WORD))]
+
+    seen: list[int] = []
+
+    async def mock_retry(func, *args, **kwargs):
+        seen.append(id(coord._scratch_tags))
+        assert coord._scratch_busy is True
+        return [1]
+
+    coord._retry = mock_retry
+
+    await coord._read_batch(plans)
+    await coord._read_batch(plans)
+
+    assert seen == [id(coord._scratch_tags)] * 2
+    assert coord._scratch_busy is False
+    assert coord._scratch_tags == []
+
+
+@pytest.mark.asyncio
+async def test_read_batch_uses_groups_built_with_cache(
+    coord_factory, dummy_client, monkeypatch
+):
+    """Test due plans map onto the groups precomputed by _build_tag_cache."""
+    coord = coord_factory()
+    coord._items = {
+        "topic/a": "DB1,W0",
+        "topic/b": "DB1,W0",
+        "topic/c": "DB1,W2",
+    }
+    coord._build_tag_cache()
+    assert len(coord._batch_groups) == 2
+
+    def fail_grouping(plans):
+        raise AssertionError("groups should be precomputed")
+
+    monkeypatch.setattr(coordinator, "group_batch_plans", fail_grouping)
+
+    client = dummy_client([[5]])
+    coord._client = client
+
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    coord._retry = mock_retry
+
+    results = await coord._read_batch([coord._plans_batch["topic/b"]])
+
+    assert client.calls == [([coord._batch_groups[0][0]], True)]
+    assert results == {"topic/a": 5, "topic/b": 5}
+
+
+def test_due_batch_groups_returns_prebuilt_list_when_all_due(coord_factory):
+    """Test a poll with every plan due reuses the prebuilt groups and tags."""
+    coord = coord_factory()
+    coord._items = {"topic/a": "DB1,W0", "topic/b": "DB1,W2"}
+    coord._build_tag_cache()
+
+    groups = coord._due_batch_groups(list(coord._plans_batch.values()))
+    assert groups is coord._batch_groups
+    assert coord._batch_tags == [tag for tag, _ in groups]
+
+    partial = coord._due_batch_groups([coord._plans_batch["topic/b"]])
+    assert partial == [coord._batch_groups[1]]
+
+
 @pytest.mark.asyncio
 async def test_read_batch_raises_on_error(coord_factory, dummy_tag, dummy_client):
     """Test read batch raises on client error."""
@@ -184,8 +286,8 @@ async def test_read_batch_raises_on_error(coord_factory, dummy_tag, dummy_client
     client = dummy_client([OSError("boom")])
     coord._client = client
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
 
@@ -206,6 +308,8 @@ async def test_async_update_data_respects_item_scan_interval(coord_factory, dumm
     plan = TagPlan("topic/a", dummy_tag())
     coord._plans_batch = {"topic/a": plan}
     coord._plans_str = {}
+    coord._all_plans_batch = tuple(coord._plans_batch.values())
+    coord._cache_valid = True
     coord._items["topic/a"] = "DB1,X0.0"
     coord._item_scan_intervals["topic/a"] = 2.0
     coord._item_next_read["topic/a"] = 0.0
@@ -226,21 +330,99 @@ async def test_async_update_data_respects_item_scan_interval(coord_factory, dumm
     data_first = await coord._async_update_data()
     assert data_first == results
     assert coord._data_cache == results
-    assert read_calls == [([plan], [])]
+    assert [(list(b), list(s)) for b, s in read_calls] == [([plan], [])]
     coord._item_next_read["topic/a"] += 100.0
 
     data_second = await coord._async_update_data()
     assert data_second == results
+    assert data_second is data_first is coord._data_cache
     assert len(read_calls) == 1
 
 
+@pytest.mark.asyncio
+async def test_async_update_data_reads_only_due_topics(coord_factory, monkeypatch):
+    """Test the due heap only yields topics whose interval elapsed."""
+    coord = coord_factory()
+    clock = [100.0]
+    monkeypatch.setattr(coordinator.time, "monotonic", lambda: clock[0])
+
+    await coord.add_item("topic/fast", "DB1,W0", scan_interval=1.0)
+    await coord.add_item("topic/slow", "DB1,W2", scan_interval=10.0)
+
+    read_calls: list[list[str]] = []
+    fail = False
+
+    async def fake_read_all(plans_batch, plans_str):
+        read_calls.append(sorted(plan.topic for plan in plans_batch))
+        if fail:
+            raise coordinator.UpdateFailed("boom")
+        return {plan.topic: 1 for plan in plans_batch}
+
+    coord._read_all = fake_read_all
+
+    await coord._async_update_data()
+    clock[0] = 101.5
+    await coord._async_update_data()
+    assert read_calls == [["topic/fast", "topic/slow"], ["topic/fast"]]
+
+    # A failed read keeps the topic due for the next cycle
+    clock[0] = 103.0
+    fail = True
+    with pytest.raises(coordinator.UpdateFailed):
+        await coord._async_update_data()
+    fail = False
+    await coord._async_update_data()
+    assert read_calls[-2:] == [["topic/fast"], ["topic/fast"]]
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_cancelled_read_keeps_topic_due(
+    coord_factory, monkeypatch
+):
+    """Test a cancelled in-flight poll puts its topics back on the due heap."""
+    coord = coord_factory()
+    clock = [100.0]
+    monkeypatch.setattr(coordinator.time, "monotonic", lambda: clock[0])
+
+    await coord.add_item("topic/a", "DB1,W0", scan_interval=1.0)
+    coord._data_cache["topic/a"] = 0
+
+    started = asyncio.Event()
+    reads: list[int] = []
+
+    class SlowClient:
+        is_connected = True
+
+        async def read(self, tags, optimize=True):
+            reads.append(len(tags))
+            if len(reads) == 1:
+                started.set()
+                await asyncio.Event().wait()
+            return [5]
+
+    coord._client = SlowClient()
+
+    task = asyncio.ensure_future(coord._async_update_data())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert coord._due_heap
+    data = await coord._async_update_data()
+    assert len(reads) == 2
+    assert data["topic/a"] == 5
+
+
 # ============================================================================
 # Error Handling Tests
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_read_all_raises_update_failed_on_connection_error(coord_factory):
+async def test_read_all_raises_update_failed_on_connection_error(
+    coord_factory, dummy_tag
+):
     """Test read_all raises UpdateFailed on connection error."""
     coord = coord_factory()
 
@@ -250,7 +432,7 @@ async def test_read_all_raises_update_failed_on_connection_error(coord_factory):
     coord._ensure_connected = raise_connect
 
     with pytest.raises(coordinator.UpdateFailed) as err:
-        await coord._read_all([], [])
+        await coord._read_all([TagPlan("topic/a", dummy_tag())], [])
 
     assert "connect boom" in str(err.value)
 
@@ -268,7 +450,7 @@ async def test_read_all_raises_update_failed_on_read_error(coord_factory, dummy_
 
     coord._drop_connection = fake_drop
 
-    async def raise_read(plans):
+    async def raise_read(plans, plans_str=()):
         raise RuntimeError("read boom")
 
     coord._read_batch = raise_read
@@ -286,72 +468,51 @@ async def test_read_all_raises_update_failed_on_read_error(coord_factory, dummy_
 
 
 @pytest.mark.asyncio
-async def test_read_strings_raises_on_timeout(coord_factory, monkeypatch, caplog):
-    """Test read_strings raises on timeout."""
+async def test_read_batch_includes_strings_in_same_request(
+    coord_factory, dummy_tag, dummy_client
+):
+    """Test strings ride along in the scalar batch request."""
     coord = coord_factory()
 
-    plans = [
+    tag = dummy_tag(data_type=coordinator.DataType.WORD, start=0)
+    plans_batch = [TagPlan("topic/int", tag)]
+    plans_str = [
         StringPlan("topic/a", 1, 0, 254),
-        StringPlan("topic/b", 2, 0, 254),
+        StringPlan("topic/b", 2, 10, 20, is_wstring=True),
     ]
 
-    times = iter([10.0, 60.0])
-    monkeypatch.setattr(coordinator.time, "monotonic", lambda: next(times, 999.0))
-
-    read_calls = []
+    client = dummy_client([[7, "hello", "world"]])
+    coord._client = client
 
-    async def fake_read(db, start, length, is_wstring=False):
-        read_calls.append((db, start))
-        return "value"
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
-    coord._read_s7_string = fake_read
+    coord._retry = mock_retry
 
-    with pytest.raises(coordinator.UpdateFailed) as err:
-        await coord._read_strings(plans, deadline=50.0)
+    results = await coord._read_batch(plans_batch, plans_str)
 
-    assert "timeout" in str(err.value).lower()
-    assert read_calls == [(1, 0)]
-    assert any("String read timeout" in message for message in caplog.messages)
+    assert client.calls == [([tag, plans_str[0].tag, plans_str[1].tag], True)]
+    assert plans_str[0].tag.data_type == coordinator.DataType.STRING
+    assert plans_str[1].tag.data_type == coordinator.DataType.WSTRING
+    assert results == {"topic/int": 7, "topic/a": "hello", "topic/b": "world"}
 
 
 @pytest.mark.asyncio
-async def test_read_strings_raises_on_error(coord_factory, monkeypatch, caplog):
-    """Test read_strings raises on read error."""
+async def test_read_all_propagates_string_failures(coord_factory):
+    """Test read_all propagates string reading failures."""
     coord = coord_factory()
 
     plans = [StringPlan("topic/a", 1, 0, 254)]
 
-    async def fake_read(db, start, length, is_wstring=False):
+    async def mock_retry(func, *args, **kwargs):
         raise RuntimeError("boom")
 
-    coord._read_s7_string = fake_read
-    monkeypatch.setattr(coordinator.time, "monotonic", lambda: 0.0)
+    coord._retry = mock_retry
 
     with pytest.raises(coordinator.UpdateFailed) as err:
-        await coord._read_strings(plans, deadline=50.0)
+        await coord._read_all([], plans)
 
     assert "boom" in str(err.value)
-    assert any("String read error" in message for message in caplog.messages)
-
-
-@pytest.mark.asyncio
-async def test_read_all_propagates_string_failures(coord_factory):
-    """Test read_all propagates string reading failures."""
-    coord = coord_factory()
-
-    plans = [StringPlan("topic/a", 1, 0, 254)]
-
-    async def fake_read_batch(plans):
-        return {}
-
-    async def fake_read_strings(plans, deadline):
-        raise coordinator.UpdateFailed("timeout")
-
-    coord._read_batch = fake_read_batch
-    coord._read_strings = fake_read_strings
-
-    with pytest.raises(coordinator.UpdateFailed):
-        await coord._read_all([], plans)
 
 
 # ============================================================================
@@ -388,7 +549,7 @@ async def test_read_one_handles_bit_string_and_scalars(coord_factory, dummy_tag,
     bit_tag = dummy_tag(data_type=coordinator.DataType.BIT)
     monkeypatch.setattr(coordinator, "parse_tag", lambda addr: bit_tag)
 
-    async def mock_retry_bit(func):
+    async def mock_retry_bit(func, *args, **kwargs):
         return [1]
 
     coord._retry = mock_retry_bit
@@ -398,7 +559,7 @@ async def test_read_one_handles_bit_string_and_scalars(coord_factory, dummy_tag,
     real_tag = DummyTag(data_type=coordinator.DataType.REAL)
     monkeypatch.setattr(coordinator, "parse_tag", lambda addr: real_tag)
 
-    async def mock_retry_real(func):
+    async def mock_retry_real(func, *args, **kwargs):
         return [1.234]
 
     coord._retry = mock_retry_real
@@ -423,8 +584,8 @@ async def test_write_handles_numeric_types(coord_factory, dummy_tag, monkeypatch
 
     coord._client = DummyClient()
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
 
@@ -616,6 +777,38 @@ async def test_connect_calls_ensure_connected(monkeypatch):
     assert len(connected) == 1
 
 
+@pytest.mark.asyncio
+async def test_ensure_connected_bounds_client_io_by_op_timeout(monkeypatch):
+    """Test the client is created with op_timeout as its I/O timeout."""
+    hass = coordinator.HomeAssistant()
+    coord = S7Coordinator(hass, host="plc.local", op_timeout=2.5)
+
+    created = []
+
+    class FakeClient:
+        is_connected = False
+
+        def __init__(self, *args, **kwargs):
+            created.append(kwargs)
+
+        async def connect(self):
+            self.is_connected = True
+
+    monkeypatch.setattr(coordinator.pyS7, "AsyncS7Client", FakeClient)
+
+    await coord._ensure_connected()
+    assert created[0]["timeout"] == 2.5
+
+
+def test_data_is_published_cache_before_first_refresh():
+    """Test coordinator.data is the value cache even before any refresh."""
+    hass = coordinator.HomeAssistant()
+    coord = S7Coordinator(hass, host="plc.local")
+
+    assert coord.data == {}
+    assert coord.data is coord._data_cache
+
+
 @pytest.mark.asyncio
 async def test_disconnect_calls_drop_connection(monkeypatch):
     """Test disconnect method calls _drop_connection."""
@@ -775,14 +968,106 @@ def test_add_item_invalidates_cache(coord_factory, monkeypatch):
     # Add some fake plans
     coord._plans_batch = {"fake": None}
     coord._plans_str = {"fake": None}
-    coord._tag_cache = {"fake": None}
     
     asyncio.run(coord.add_item("sensor:DB1,REAL0", "DB1,REAL0"))
     
     # Cache should be cleared
     assert len(coord._plans_batch) == 0
     assert len(coord._plans_str) == 0
-    assert len(coord._tag_cache) == 0
+    assert coord._cache_valid is False
+
+
+def test_rebuild_parses_only_new_addresses(coord_factory, monkeypatch):
+    """Test parsed tags survive add_item so rebuilds skip known addresses."""
+    coord = coord_factory()
+    parsed = []
+    original_parse = plans_module.parse_tag
+
+    def counting_parse(address):
+        parsed.append(address)
+        return original_parse(address)
+
+    monkeypatch.setattr(plans_module, "parse_tag", counting_parse)
+
+    asyncio.run(coord.add_item("a", "DB1,W0"))
+    coord._build_tag_cache()
+    asyncio.run(coord.add_item("b", "DB1,W2"))
+    coord._build_tag_cache()
+
+    assert parsed == ["DB1,W0", "DB1,W2"]
+    assert set(coord._plans_batch) == {"a", "b"}
+
+
+def test_add_item_same_registration_keeps_cache(coord_factory):
+    """Test re-registering an unchanged topic does not invalidate plans."""
+    coord = coord_factory()
+    asyncio.run(coord.add_item("sensor:DB1,REAL0", "DB1,REAL0", 2.0, 1))
+    coord._build_tag_cache()
+    plans = coord._plans_batch
+    heap_len = len(coord._due_heap)
+
+    asyncio.run(coord.add_item("sensor:DB1,REAL0", "DB1,REAL0", 2.0, 1))
+    assert coord._cache_valid is True
+    assert coord._plans_batch is plans
+    assert len(coord._due_heap) == heap_len
+
+    asyncio.run(coord.add_item("sensor:DB1,REAL0", "DB1,REAL0", 2.0, 2))
+    assert coord._cache_valid is False
+
+
+def test_add_items_registers_all_and_invalidates_once(coord_factory, monkeypatch):
+    """Test add_items records every topic with a single cache invalidation."""
+    coord = coord_factory()
+    invalidations = []
+    original = coord._invalidate_cache
+    monkeypatch.setattr(
+        coord, "_invalidate_cache", lambda: invalidations.append(1) or original()
+    )
+
+    asyncio.run(
+        coord.add_items(
+            [
+                ("cover:opened:DB1,X0.0", "DB1,X0.0", 2.0),
+                ("cover:closed:DB1,X0.1", "DB1,X0.1", None),
+            ]
+        )
+    )
+
+    assert coord._items == {
+        "cover:opened:DB1,X0.0": "DB1,X0.0",
+        "cover:closed:DB1,X0.1": "DB1,X0.1",
+    }
+    assert coord.get_scan_interval("cover:opened:DB1,X0.0") == 2.0
+    assert invalidations == [1]
+    assert coord.update_interval.total_seconds() == min(
+        2.0, coord._default_scan_interval
+    )
+
+    asyncio.run(coord.add_items([("cover:opened:DB1,X0.0", "DB1,X0.0", 2.0)]))
+    assert invalidations == [1]
+
+
+@pytest.mark.asyncio
+async def test_build_tag_cache_runs_once_when_no_plans(coord_factory, monkeypatch):
+    """Test plans are not rebuilt every poll when they are legitimately empty."""
+    coord = coord_factory()
+    coord._items["topic/bad"] = "BAD_ADDR"
+
+    builds = 0
+    original_build = coord._build_tag_cache
+
+    def counting_build():
+        nonlocal builds
+        builds += 1
+        original_build()
+
+    monkeypatch.setattr(coord, "_build_tag_cache", counting_build)
+
+    await coord._async_update_data()
+    await coord._async_update_data()
+
+    assert builds == 1
+    assert coord._cache_valid is True
 
 
 def test_normalize_scan_interval_none_uses_default(coord_factory):
@@ -902,8 +1187,8 @@ async def test_write_multi_single_write(coord_factory, monkeypatch):
     coord = coord_factory()
     coord._client = MagicMock()
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
     
@@ -924,8 +1209,8 @@ async def test_write_multi_multiple_writes(coord_factory, monkeypatch):
     coord = coord_factory()
     coord._client = MagicMock()
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
     
@@ -957,8 +1242,8 @@ async def test_write_multi_type_conversion(coord_factory, monkeypatch):
     coord = coord_factory()
     coord._client = MagicMock()
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
     
@@ -987,8 +1272,8 @@ async def test_write_multi_invalid_address(coord_factory):
     coord = coord_factory()
     coord._client = MagicMock()
 
-    async def mock_retry(func):
-        return func()
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
 
     coord._retry = mock_retry
     
@@ -1106,3 +1391,182 @@ async def test_write_batched_no_notification_on_success(coord_factory, monkeypat
     
     # Verify no notification was created
     coord.hass.services.async_call.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_write_batched_window_not_extended_by_later_writes(
+    coord_factory, monkeypatch
+):
+    """Test the flush timer is armed once per batch, not reset on each write."""
+    coord = coord_factory()
+    flushed = []
+
+    async def mock_write_multi(writes):
+        flushed.append([addr for addr, _ in writes])
+        return {addr: True for addr, _ in writes}
+
+    monkeypatch.setattr(coord, 'write_multi', mock_write_multi)
+
+    first = asyncio.create_task(coord.write_batched('DB1,X0.0', True))
+    await asyncio.sleep(0)
+    timer = coord._write_batch_timer
+    assert timer is not None
+
+    second = asyncio.create_task(coord.write_batched('DB1,W10', 42))
+    await asyncio.sleep(0)
+    assert coord._write_batch_timer is timer
+
+    await asyncio.gather(first, second)
+    assert flushed == [['DB1,X0.0', 'DB1,W10']]
+    assert coord._write_batch_timer is None
+
+
+# ============================================================================
+# Hot Path Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_read_s7_string_reuses_tag(coord_factory):
+    """Test repeated string reads share one prebuilt S7Tag."""
+    coord = coord_factory()
+    seen = []
+
+    async def mock_retry(func, *args, **kwargs):
+        seen.append(args[0][0])
+        return ["text"]
+
+    coord._retry = mock_retry
+
+    assert await coord._read_s7_string(1, 10, 20) == "text"
+    assert await coord._read_s7_string(1, 10, 20) == "text"
+    await coord._read_s7_string(1, 10, 20, is_wstring=True)
+
+    assert seen[0] is seen[1]
+    assert seen[2] is not seen[0]
+    assert seen[2].data_type == coordinator.DataType.WSTRING
+
+
+@pytest.mark.asyncio
+async def test_read_all_skips_connect_when_nothing_due(coord_factory):
+    """Test _read_all returns early without connecting when no plans are due."""
+    coord = coord_factory()
+
+    async def fail_ensure():
+        raise AssertionError("should not connect")
+
+    coord._ensure_connected = fail_ensure
+
+    assert await coord._read_all([], []) == {}
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_refreshes_debug_flag(coord_factory, monkeypatch):
+    """Test the cached debug flag follows the logger level on every poll."""
+    coord = coord_factory()
+    coord._log_debug = True
+
+    monkeypatch.setattr(
+        coordinator._LOGGER, "isEnabledFor", lambda level: False
+    )
+
+    await coord._async_update_data()
+
+    assert coord._log_debug is False
+
+
+@pytest.mark.asyncio
+async def test_async_update_data_passes_published_plans_when_all_due(coord_factory):
+    """Test a poll with every topic due reads the build-time plan tuples."""
+    coord = coord_factory()
+    await coord.add_item("topic/a", "DB1,W0")
+    await coord.add_item("topic/b", "DB1,S10.20")
+    seen = []
+
+    async def fake_read_all(plans_batch, plans_str):
+        seen.append((plans_batch, plans_str))
+        return {}
+
+    coord._read_all = fake_read_all
+
+    await coord._async_update_data()
+
+    assert seen[0][0] is coord._all_plans_batch
+    assert seen[0][1] is coord._all_plans_str
+    assert [p.topic for p in coord._all_plans_str] == ["topic/b"]
+
+
+@pytest.mark.asyncio
+async def test_read_batch_full_read_uses_flat_dispatch(coord_factory, dummy_client):
+    """Test a full read maps values through the build-time dispatch rows."""
+    coord = coord_factory()
+    coord._items = {
+        "topic/w": "DB1,W0",
+        "topic/w2": "DB1,W0",
+        "topic/r": "DB1,R4",
+        "topic/s": "DB1,S10.8",
+    }
+    coord._build_tag_cache()
+    assert coord._batch_topics is None
+
+    client = dummy_client([[7, 1.26, "txt"]])
+    coord._client = client
+
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    coord._retry = mock_retry
+
+    results = await coord._read_batch(
+        coord._all_plans_batch, coord._all_plans_str
+    )
+
+    assert results == {"topic/w": 7, "topic/w2": 7, "topic/r": 1.3, "topic/s": "txt"}
+
+
+@pytest.mark.asyncio
+async def test_read_batch_full_scalar_read_passes_prebuilt_tags(
+    coord_factory, dummy_client
+):
+    """Test a full scalar-only read sends the cache-time tag list as is."""
+    coord = coord_factory()
+    coord._items = {"topic/a": "DB1,W0", "topic/b": "DB1,I2"}
+    coord._build_tag_cache()
+    prebuilt = list(coord._batch_tags)
+
+    coord._client = dummy_client([[3, -4]])
+    sent = []
+
+    async def mock_retry(func, *args, **kwargs):
+        sent.append(args[0])
+        return func(*args, **kwargs)
+
+    coord._retry = mock_retry
+
+    results = await coord._read_batch(coord._all_plans_batch)
+
+    assert sent[0] is coord._batch_tags
+    assert coord._batch_tags == prebuilt
+    assert coord._scratch_busy is False
+    assert results == {"topic/a": 3, "topic/b": -4}
+
+
+@pytest.mark.asyncio
+async def test_read_batch_passthrough_zips_topics(coord_factory, dummy_client):
+    """Test single-plan groups without post-processing zip values to topics."""
+    coord = coord_factory()
+    coord._items = {"topic/a": "DB1,W0", "topic/b": "DB1,I2"}
+    coord._build_tag_cache()
+    assert coord._batch_topics == ("topic/a", "topic/b")
+
+    client = dummy_client([[3, -4]])
+    coord._client = client
+
+    async def mock_retry(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    coord._retry = mock_retry
+
+    results = await coord._read_batch(coord._all_plans_batch)
+
+    assert results == {"topic/a": 3, "topic/b": -4}
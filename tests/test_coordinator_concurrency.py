@@ -107,6 +107,8 @@ async def test_disconnect_during_read():
     # Patch _build_tag_cache so _async_update_data has something to read
     coord._plans_batch = {"topic/a": plans[0]}
     coord._plans_str = {}
+    coord._all_plans_batch = tuple(coord._plans_batch.values())
+    coord._cache_valid = True
     coord._items["topic/a"] = "DB1.DBW0"
     coord._item_scan_intervals["topic/a"] = 0.5
     coord._item_next_read["topic/a"] = 0.0
@@ -205,6 +207,8 @@ async def test_write_and_poll_no_race():
     tag = DummyTag(data_type=coordinator.DataType.WORD, start=0)
     coord._plans_batch = {"topic/a": TagPlan("topic/a", tag)}
     coord._plans_str = {}
+    coord._all_plans_batch = tuple(coord._plans_batch.values())
+    coord._cache_valid = True
     coord._items["topic/a"] = "DB1,W0"
     coord._item_scan_intervals["topic/a"] = 0.5
     coord._item_next_read["topic/a"] = 0.0
@@ -279,6 +283,8 @@ async def test_stale_read_discarded_after_reconnect():
     tag = DummyTag(data_type=coordinator.DataType.WORD, start=0)
     coord._plans_batch = {"topic/a": TagPlan("topic/a", tag)}
     coord._plans_str = {}
+    coord._all_plans_batch = tuple(coord._plans_batch.values())
+    coord._cache_valid = True
     coord._items["topic/a"] = "DB1.DBW0"
     coord._item_scan_intervals["topic/a"] = 0.5
     coord._item_next_read["topic/a"] = 0.0
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
@@ -34,6 +35,7 @@ def mock_coordinator():
     coord.data = {}
     coord.is_connected.return_value = True
     coord.add_item = AsyncMock()
+    coord.add_items = AsyncMock()
     coord.async_request_refresh = AsyncMock()
     coord.write = MagicMock(return_value=True)
     coord.write_batched = AsyncMock(return_value=None)
@@ -209,6 +211,24 @@ def test_is_closed_state_topics_unknown(cover_factory, mock_coordinator):
     assert cover.is_closed is None
 
 
+def test_coordinator_update_idle_skips_limit_switch_check(cover_factory):
+    """Test an idle cover does not read limit switches on coordinator update."""
+    cover = cover_factory(
+        opened_topic="cover:opened:db1,x1.0",
+        closed_topic="cover:closed:db1,x1.1",
+        use_state_topics=True,
+    )
+    calls = []
+    cover._get_states = lambda: calls.append(True) or (False, False)
+
+    cover._handle_coordinator_update()
+    assert calls == []
+
+    cover._is_opening = True
+    cover._handle_coordinator_update()
+    assert calls == [True]
+
+
 def test_is_opening(cover_factory):
     """Test is_opening property."""
     cover = cover_factory()
@@ -242,6 +262,51 @@ async def test_async_open_cover(cover_factory, mock_coordinator):
     assert cover._is_opening is True
     assert cover._is_closing is False
     assert cover._assumed_closed is False
+    mock_coordinator.async_request_refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_schedule_reset_uses_loop_timer(cover_factory):
+    """Test the operate-time reset runs on the loop's monotonic timer."""
+    cover = cover_factory(operate_time=0.01)
+    cover.hass.loop = asyncio.get_running_loop()
+    completed = []
+
+    async def fake_complete(direction):
+        completed.append(direction)
+
+    cover._complete_operation = fake_complete
+    cover._schedule_reset("open")
+    assert "open" in cover._reset_handles
+
+    await asyncio.sleep(0.05)
+    assert completed == ["open"]
+    assert "open" not in cover._reset_handles
+
+    cover._schedule_reset("close")
+    cover._cancel_reset("close")
+    await asyncio.sleep(0.05)
+    assert completed == ["open"]
+
+
+@pytest.mark.asyncio
+async def test_complete_operation_releases_output_and_refreshes(
+    cover_factory, mock_coordinator
+):
+    """Test completing a movement clears the output and refreshes end stops."""
+    cover = cover_factory(
+        opened_topic="cover:opened:db1,x1.0",
+        closed_topic="cover:closed:db1,x1.1",
+        use_state_topics=True,
+    )
+    cover._is_opening = True
+
+    await cover._complete_operation("open")
+
+    mock_coordinator.write_batched.assert_called_with("db1,x0.0", False)
+    assert cover._is_opening is False
+    assert cover._is_closing is False
+    mock_coordinator.async_request_refresh.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -412,6 +477,16 @@ def test_extra_state_attributes_with_state_topics(cover_factory):
     assert attrs["state_topics_used"] is True
     assert attrs["cover_type"] == "open/close"
 
+
+def test_extra_state_attributes_returns_fresh_dict(cover_factory):
+    """Test callers cannot mutate the precomputed static attributes."""
+    cover = cover_factory()
+
+    attrs = cover.extra_state_attributes
+    attrs["cover_type"] = "changed"
+    assert cover.extra_state_attributes["cover_type"] == "open/close"
+
+
 # ============================================================================
 # async_setup_entry Tests
 # ============================================================================
@@ -510,8 +585,13 @@ async def test_async_setup_entry_with_state_addresses(fake_hass, mock_coordinato
         
         await async_setup_entry(fake_hass, config_entry, async_add_entities)
     
-    # Should call add_item twice (for opened and closed topics)
-    assert mock_coordinator.add_item.call_count == 2
+    # Opened and closed topics are registered together in one call
+    mock_coordinator.add_items.assert_awaited_once_with(
+        [
+            ("cover:opened:db1,x1.0", "db1,x1.0", None),
+            ("cover:closed:db1,x1.1", "db1,x1.1", None),
+        ]
+    )
     entities = async_add_entities.call_args[0][0]
     assert entities[0]._opened_state_address == "db1,x1.0"
     assert entities[0]._closed_state_address == "db1,x1.1"
@@ -672,7 +752,8 @@ async def test_position_cover_setup(fake_hass, mock_coordinator, device_info):
         
         await async_setup_entry(fake_hass, config_entry, async_add_entities)
     
-    mock_coordinator.add_item.assert_called_once()
+    mock_coordinator.add_items.assert_called_once()
+    assert len(mock_coordinator.add_items.call_args[0][0]) == 1
     mock_coordinator.async_request_refresh.assert_called_once()
     
     entities = async_add_entities.call_args[0][0]
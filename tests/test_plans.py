@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from custom_components.s7plc.address import DataType
@@ -38,4 +40,76 @@ def test_apply_postprocess_rounds_real_values(monkeypatch):
     postprocess = batch_plans[0].postprocess
     assert postprocess is not None
     assert postprocess(3.14159) == pytest.approx(3.1)
-    assert postprocess(2) == pytest.approx(2.0)
\ No newline at end of file
+    assert postprocess(2) == pytest.approx(2.0)
+
+
+def test_build_plans_keeps_bit_tags_as_configured():
+    """BIT tags sharing a byte stay BIT; pyS7's optimizer merges them."""
+
+    batch_plans, _ = plans.build_plans(
+        {
+            "topic/bit0": "DB1,X4.0",
+            "topic/bit3": "DB1,X4.3",
+        }
+    )
+
+    by_topic = {plan.topic: plan for plan in batch_plans}
+    assert by_topic["topic/bit0"].tag.data_type == DataType.BIT
+    assert by_topic["topic/bit3"].tag.data_type == DataType.BIT
+    assert by_topic["topic/bit3"].tag.bit_offset == 3
+    assert by_topic["topic/bit0"].postprocess is None
+
+
+def test_group_batch_plans_deduplicates_identical_tags():
+    """Plans reading the same tag should share one group."""
+
+    batch_plans, _ = plans.build_plans(
+        {"topic/a": "DB1,W0", "topic/b": "DB1,I4", "topic/c": "DB1,W0"}
+    )
+
+    groups = plans.group_batch_plans(batch_plans)
+
+    assert [[plan.topic for plan in group] for _, group in groups] == [
+        ["topic/a", "topic/c"],
+        ["topic/b"],
+    ]
+    assert groups[0][0] == batch_plans[0].tag
+
+
+def test_build_plans_skips_postprocess_for_passthrough_types():
+    """Non-REAL tags and full-precision REALs need no post-processing."""
+
+    batch_plans, _ = plans.build_plans(
+        {"topic/int": "DB1,I0", "topic/real": "DB1,R2"},
+        precisions={"topic/real": None},
+    )
+
+    assert [plan.postprocess for plan in batch_plans] == [None, None]
+
+
+def test_build_plans_shares_rounding_callable_per_precision():
+    """REAL plans with the same precision should share one post-processor."""
+
+    batch_plans, _ = plans.build_plans(
+        {"topic/a": "DB1,R0", "topic/b": "DB1,R4", "topic/c": "DB1,R8"},
+        precisions={"topic/c": 3},
+    )
+    by_topic = {plan.topic: plan for plan in batch_plans}
+
+    assert by_topic["topic/a"].postprocess is by_topic["topic/b"].postprocess
+    assert by_topic["topic/c"].postprocess is not by_topic["topic/a"].postprocess
+    assert by_topic["topic/c"].postprocess(1.23456) == pytest.approx(1.235)
+
+
+def test_plans_are_frozen():
+    """Plans are immutable once built so they can be shared safely."""
+
+    batch_plans, string_plans = plans.build_plans(
+        {"topic/int": "DB1,W0", "topic/string": "DB1,S4.10"}
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        batch_plans[0].postprocess = None
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        string_plans[0].length = 1
+    assert string_plans[0].tag.data_type == DataType.STRING